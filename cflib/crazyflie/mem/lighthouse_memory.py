@@ -423,7 +423,7 @@ class LighthouseMemHelper:
 
         def _write_next_object(self):
             if len(self._objects_to_write) > 0:
-                id = list(self._objects_to_write.keys())[0]
+                id = next(iter(self._objects_to_write))
                 data = self._objects_to_write.pop(id)
                 self._write_fcn(id, data, self._data_written, write_failed_cb=self._write_failed)
             else:
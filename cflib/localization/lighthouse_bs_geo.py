@@ -34,6 +34,16 @@ class LighthouseBsGeoEstimator:
     of a lighthouse base station, given angles measured using a lighthouse deck.
     """
 
+    # Rotation from the open cv coordinate system to the CF coordinate system
+    _R_OPENCV_TO_CF = np.array([
+        [0.0, 0.0, 1.0],
+        [-1.0, 0.0, 0.0],
+        [0.0, -1.0, 0.0],
+    ])
+
+    # The inverse rotation, from CF to open cv
+    _R_CF_TO_OPENCV = _R_OPENCV_TO_CF.T.copy()
+
     def __init__(self):
         self._directions = {
             self._hash_sensor_order([2, 0, 1, 3]): math.radians(0),
@@ -55,7 +65,7 @@ class LighthouseBsGeoEstimator:
         sensor_distance_length = 0.03
 
         # Sensor positions in world coordinates, open cv style
-        self._lighthouse_3d = np.float32(
+        self._lighthouse_3d = np.float64(
             [
                 [-sensor_distance_width / 2, 0, -sensor_distance_length / 2],
                 [sensor_distance_width / 2, 0, -sensor_distance_length / 2],
@@ -85,7 +95,11 @@ class LighthouseBsGeoEstimator:
         :param bs_vectors A list of 4 LighthouseBsVector objects specifying vectors to the 4 sensors
         :return rot_bs_in_cf_coord: Rotation matrix of the BS in the CFs coordinate system
         :return pos_bs_in_cf_coord: Position vector of the BS in the CFs coordinate system
+        :raises Exception: If fewer than 4 vectors are provided, no estimation is attempted
         """
+        if len(bs_vectors) < 4:
+            raise Exception('Vectors to all 4 sensors are required')
+
         guess_yaw = self._find_initial_yaw_guess(bs_vectors)
         rvec_guess, tvec_guess = self._convert_yaw_to_open_cv(guess_yaw)
         rw_ocv, tw_ocv = self._estimate_pose_by_pnp(bs_vectors, rvec_guess, tvec_guess)
@@ -107,15 +121,7 @@ class LighthouseBsGeoEstimator:
         # Sort sensors in the order they are hit by the horizontal sweep
         # and use the order to figure out roughly the direction to the
         # base station
-        sweeps_x = {
-            0: bs_vectors[0].lh_v1_horiz_angle,
-            1: bs_vectors[1].lh_v1_horiz_angle,
-            2: bs_vectors[2].lh_v1_horiz_angle,
-            3: bs_vectors[3].lh_v1_horiz_angle
-        }
-
-        ordered_map = {k: v for k, v in sorted(sweeps_x.items(), key=lambda item: item[1])}
-        sensor_order = list(ordered_map.keys())
+        sensor_order = sorted(range(4), key=lambda sensor: bs_vectors[sensor].lh_v1_horiz_angle)
 
         # The base station is roughly in this direction, in CF (world) coordinates
         return self._directions[self._hash_sensor_order(sensor_order)]
@@ -155,20 +161,17 @@ class LighthouseBsGeoEstimator:
             [0.0, e_s, e_c],
         ])
 
-        R = np.dot(R_rot_x, R_rot_y)
+        R = R_rot_x @ R_rot_y
         rvec_start, _ = cv.Rodrigues(R)
 
         return rvec_start, tvec_start
 
     def _estimate_pose_by_pnp(self, bs_vectors, rvec_start, tvec_start):
-        # Sensors as seen by the "camera"
-        lighthouse_image_projection = np.float32(
-            [
-                [-math.tan(bs_vectors[0].lh_v1_horiz_angle), -math.tan(bs_vectors[0].lh_v1_vert_angle)],
-                [-math.tan(bs_vectors[1].lh_v1_horiz_angle), -math.tan(bs_vectors[1].lh_v1_vert_angle)],
-                [-math.tan(bs_vectors[2].lh_v1_horiz_angle), -math.tan(bs_vectors[2].lh_v1_vert_angle)],
-                [-math.tan(bs_vectors[3].lh_v1_horiz_angle), -math.tan(bs_vectors[3].lh_v1_vert_angle)]
-            ])
+        # Sensors as seen by the "camera". All angles are collected in one array
+        # and projected in a single vectorized operation.
+        angles = np.array(
+            [(bs_vector.lh_v1_horiz_angle, bs_vector.lh_v1_vert_angle) for bs_vector in bs_vectors[:4]])
+        lighthouse_image_projection = -np.tan(angles)
 
         _ret, rvec_est, tvec_est = cv.solvePnP(
             self._lighthouse_3d,
@@ -188,24 +191,13 @@ class LighthouseBsGeoEstimator:
 
     def _cam_to_world(self, rvec_c, tvec_c):
         R_c, _ = cv.Rodrigues(rvec_c)
-        R_w = np.linalg.inv(R_c)
-        tvec_w = -np.matmul(R_w, tvec_c)
+        # The inverse of a rotation matrix is its transpose
+        R_w = R_c.T
+        tvec_w = -R_w @ tvec_c
         return R_w, tvec_w
 
     def _opencv_to_cf(self, R_cv, t_cv):
-        R_opencv_to_cf = np.array([
-            [0.0, 0.0, 1.0],
-            [-1.0, 0.0, 0.0],
-            [0.0, -1.0, 0.0],
-        ])
-
-        R_cf_to_opencv = np.array([
-            [0.0, -1.0, 0.0],
-            [0.0, 0.0, -1.0],
-            [1.0, 0.0, 0.0],
-        ])
-
-        t_cf = np.dot(R_opencv_to_cf, t_cv)
-        R_cf = np.dot(R_opencv_to_cf, np.dot(R_cv, R_cf_to_opencv))
+        t_cf = self._R_OPENCV_TO_CF @ t_cv
+        R_cf = self._R_OPENCV_TO_CF @ R_cv @ self._R_CF_TO_OPENCV
 
         return R_cf, t_cf
@@ -44,6 +44,7 @@ class LighthouseBsVector:
         """
         self._lh_v1_horiz_angle = lh_v1_horiz_angle
         self._lh_v1_vert_angle = lh_v1_vert_angle
+        self._cart = None
 
     @classmethod
     def from_lh2(cls, lh_v2_angle_1, lh_v2_angle_2):
@@ -101,10 +102,16 @@ class LighthouseBsVector:
     @property
     def cart(self):
         """
-        A normalized vector in cartesian coordinates
+        A normalized vector in cartesian coordinates.
+        The vector is calculated on first access and cached, it is read only.
         """
-        v = np.array((1, math.tan(self._lh_v1_horiz_angle), math.tan(self._lh_v1_vert_angle)))
-        return v / np.linalg.norm(v)
+        if self._cart is None:
+            tan_horiz = math.tan(self._lh_v1_horiz_angle)
+            tan_vert = math.tan(self._lh_v1_vert_angle)
+            norm = math.sqrt(1 + tan_horiz ** 2 + tan_vert ** 2)
+            self._cart = np.array((1 / norm, tan_horiz / norm, tan_vert / norm))
+            self._cart.setflags(write=False)
+        return self._cart
 
     def _q(self):
         return math.tan(self._lh_v1_vert_angle) / math.sqrt(1 + math.tan(self._lh_v1_horiz_angle) ** 2)
@@ -81,8 +81,8 @@ class LighthouseSweepAngleAverageReader():
 
         # We store all samples in the storage for averaging when data is collected
         # The storage is a dictionary keyed on the base station channel
-        # Each entry is a list of 4 lists, one per sensor.
-        # Each list contains LighthouseBsVector objects, representing the sampled sweep angles
+        # Each entry is a list of 4 tuples, one per sensor.
+        # Each tuple holds two lists of floats, the sampled horizontal and vertical sweep angles
         self._sample_storage = None
 
     def start_angle_collection(self):
@@ -104,7 +104,7 @@ class LighthouseSweepAngleAverageReader():
 
     def _data_recevied_cb(self, base_station_id, bs_vectors):
         self._store_sample(base_station_id, bs_vectors, self._sample_storage)
-        if self._has_collected_enough_data(self._sample_storage):
+        if self._has_collected_enough_data(base_station_id, self._sample_storage):
             self._reader.stop()
             if self._ready_cb:
                 averages = self._average_all_lists(self._sample_storage)
@@ -115,23 +115,23 @@ class LighthouseSweepAngleAverageReader():
         if base_station_id not in storage:
             storage[base_station_id] = []
             for sensor in range(self._reader.NR_OF_SENSORS):
-                storage[base_station_id].append([])
+                storage[base_station_id].append(([], []))
 
         for sensor in range(self._reader.NR_OF_SENSORS):
-            storage[base_station_id][sensor].append(bs_vectors[sensor])
+            horiz_angles, vert_angles = storage[base_station_id][sensor]
+            horiz_angles.append(bs_vectors[sensor].lh_v1_horiz_angle)
+            vert_angles.append(bs_vectors[sensor].lh_v1_vert_angle)
 
-    def _has_collected_enough_data(self, storage):
-        for sample_list in storage.values():
-            if len(sample_list[0]) >= self.nr_of_samples_required:
-                return True
-        return False
+    def _has_collected_enough_data(self, base_station_id, storage):
+        # Only the base station that just got a new sample can have reached the limit
+        return len(storage[base_station_id][0][0]) >= self.nr_of_samples_required
 
     def _average_all_lists(self, storage):
         result = {}
 
         for id, sample_lists in storage.items():
             averages = self._average_sample_lists(sample_lists)
-            count = len(sample_lists[0])
+            count = len(sample_lists[0][0])
             result[id] = (count, averages)
 
         return result
@@ -145,12 +145,7 @@ class LighthouseSweepAngleAverageReader():
         return result
 
     def _average_sample_list(self, sample_list):
-        sum_horiz = 0.0
-        sum_vert = 0.0
+        horiz_angles, vert_angles = sample_list
 
-        for bs_vector in sample_list:
-            sum_horiz += bs_vector.lh_v1_horiz_angle
-            sum_vert += bs_vector.lh_v1_vert_angle
-
-        count = len(sample_list)
-        return LighthouseBsVector(sum_horiz / count, sum_vert / count)
+        count = len(horiz_angles)
+        return LighthouseBsVector(sum(horiz_angles) / count, sum(vert_angles) / count)
@@ -95,3 +95,16 @@ class TestLighthouseBsGeoEstimator(unittest.TestCase):
 
         # Assert
         self.assertTrue(actual)
+
+    def test_that_estimation_is_rejected_with_too_few_vectors(self):
+        # Fixture
+        bs_vectors = [
+            LighthouseBsVector(0, 0),
+            LighthouseBsVector(0, 0),
+            LighthouseBsVector(0, 0),
+        ]
+
+        # Test
+        # Assert
+        with self.assertRaisesRegex(Exception, 'all 4 sensors'):
+            self.sut.estimate_geometry(bs_vectors)
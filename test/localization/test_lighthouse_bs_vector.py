@@ -116,3 +116,14 @@ class TestLighthouseBsVector(unittest.TestCase):
 
         # Assert
         self.assertAlmostEqual(1.0, actual)
+
+    def test_cartesian_is_cached_and_read_only(self):
+        # Fixture
+        vector = LighthouseBsVector(0.123, 0.456)
+
+        # Test
+        actual = vector.cart
+
+        # Assert
+        self.assertIs(actual, vector.cart)
+        self.assertFalse(actual.flags.writeable)